@@ -8,21 +8,43 @@ Routes:
 - /api/convert-text: Converts text to multiple sign language videos.
 - /api/convert-sentence: Converts a sentence to concatenated sign language videos.
 - /api/available-words: Lists all available sign language words.
+- /videos/{clip}.mp4: Serves clips, including byte ranges, from the in-memory clip cache.
+- /admin/profiles: Lists and downloads per-request profiles (requires `PROFILE_TOKEN`).
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from helpers.middleware import sanitize_input
 from helpers.logging_middleware import DatabaseLoggingMiddleware
+from helpers.profiling import ProfilingMiddleware
 import logging
 import time
 from routes.v0.sign_language_routes import router as sign_language_router
+from routes.v0.clip_routes import router as clip_router
+from routes.v0.admin_routes import router as admin_router
+from helpers.clip_cache import clip_cache
+from helpers.cache_warmup import run_warmup_loop
 from database.database import AppLog, SessionLocal, engine, Base
 from utils.config import settings
 
 logging.basicConfig(level=logging.DEBUG)
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.clip_cache_preload:
+        await clip_cache.preload()
+    # Warm-up calls Gemini under a rate limit, so it runs in the background instead of delaying startup
+    warmup_task = asyncio.create_task(run_warmup_loop()) if settings.cache_warmup_enabled else None
+    yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -37,6 +59,8 @@ app.add_middleware(
 # Add middleware
 app.middleware("http")(DatabaseLoggingMiddleware())
 app.include_router(sign_language_router)
+app.include_router(clip_router)
+app.include_router(admin_router)
 
 # Create tables
 Base.metadata.create_all(bind=engine)
@@ -44,7 +68,7 @@ Base.metadata.create_all(bind=engine)
 # Mount static files
 app.mount("/assets", StaticFiles(directory="assets"), name="assets")
 
-# Mount videos directory
+# Mount videos directory (clips are normally served from memory by clip_router)
 app.mount("/videos", StaticFiles(directory=str(settings.video_dir), html=True), name="videos")
 
 
@@ -105,6 +129,11 @@ async def logging_middleware(request: Request, call_next):
     return response
 
 
+# Profiling is added last so it wraps the whole middleware stack, and only when enabled
+if settings.profile_token:
+    app.middleware("http")(ProfilingMiddleware())
+
+
 if __name__ == "__main__":
     import uvicorn
     from utils.config import settings
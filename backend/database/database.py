@@ -26,4 +26,4 @@ class AppLog(Base):
     path = Column(String(255))
     status_code = Column(Integer)
     response_summary = Column(Text)
-    timestamp = Column(DateTime, default=datetime.now())
+    timestamp = Column(DateTime, default=datetime.now, index=True)
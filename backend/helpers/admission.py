@@ -0,0 +1,185 @@
+"""Module providing admission control for the LLM-backed endpoint.
+
+Every `/videos/process-text/` request ends up waiting on `GeminiClient.generate_text`, so under spikes unlimited
+concurrent requests make latency climb for everyone. This module rate limits each client with a token bucket,
+bounds the number of requests running and waiting, and sheds requests that cannot start in time with a fast
+429/503 carrying `Retry-After`.
+
+Classes:
+- TokenBucket: Per-client token bucket rate limiter.
+- AdmissionController: Rate limiting, bounded concurrency and bounded queueing with shed metrics.
+
+Functions:
+- llm_admission: FastAPI dependency that validates the input text and holds an admission slot for the duration of
+  a request.
+"""
+
+import asyncio
+import math
+import time
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from fastapi import HTTPException, Query, Request
+from utils.config import settings
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second up to `capacity` tokens."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take one token.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the number of seconds until one is available.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """Admission control with per-client rate limiting, bounded concurrency and a bounded wait queue.
+
+    Attributes:
+        rate (float): Tokens per second granted to each client.
+        burst (int): Token bucket capacity per client.
+        max_concurrency (int): Maximum number of requests running at once.
+        max_queue (int): Maximum number of requests waiting for a slot.
+        max_wait (float): Maximum seconds a request may wait for a slot.
+        shed (Counter): Number of shed requests by reason.
+
+    Example:
+        >>> controller = AdmissionController(rate=1.0, burst=5, max_concurrency=8, max_queue=32, max_wait=2.0)
+        >>> async with controller.admit('127.0.0.1'):
+        ...     await do_expensive_work()
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_concurrency: int,
+        max_queue: int,
+        max_wait: float,
+        max_clients: int = 10000,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.max_clients = max_clients
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.shed: Counter = Counter()
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _bucket_for(self, client_id: str) -> TokenBucket:
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = self._buckets[client_id] = TokenBucket(self.rate, self.burst)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        self._buckets.move_to_end(client_id)
+        return bucket
+
+    def _reject(self, status_code: int, reason: str, retry_after: float) -> HTTPException:
+        self.shed[reason] += 1
+        return HTTPException(
+            status_code=status_code,
+            detail="Too many requests" if status_code == 429 else "Server busy, try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    @asynccontextmanager
+    async def admit(self, client_id: str) -> AsyncIterator[None]:
+        """Hold a slot for the body of the `async with` block.
+
+        Raises:
+            HTTPException: 429 if the client exceeded its rate, 503 if the wait queue is full or no slot
+            became free within `max_wait` seconds.
+        """
+        retry_after = self._bucket_for(client_id).take()
+        if retry_after > 0:
+            raise self._reject(429, "rate_limited", retry_after)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise self._reject(503, "queue_full", self.max_wait)
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait)
+            except asyncio.TimeoutError:
+                raise self._reject(503, "queue_timeout", self.max_wait)
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return current queue depth, in-flight requests and admitted/shed counters."""
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+            "shed_total": sum(self.shed.values()),
+        }
+
+
+admission = AdmissionController(
+    rate=settings.llm_rate_per_client,
+    burst=settings.llm_burst,
+    max_concurrency=settings.llm_max_concurrency,
+    max_queue=settings.llm_max_queue,
+    max_wait=settings.llm_max_queue_wait,
+)
+"""Process-wide admission controller for the LLM-backed endpoint."""
+
+
+async def llm_admission(
+    request: Request,
+    text: str = Query(..., description="Text to process into sign language videos", min_length=1),
+) -> AsyncIterator[str]:
+    """FastAPI dependency admitting a request through the process-wide controller, keyed by client address.
+
+    The input text is a parameter of the dependency so that FastAPI validates it first; invalid requests are
+    rejected with 422 without taking a rate limit token or a slot.
+
+    Yields:
+        str: The validated input text.
+
+    Raises:
+        HTTPException: 422 if the text is blank, 429 or 503 if the request is shed.
+    """
+    if not text.strip():
+        raise HTTPException(status_code=422, detail="Input text cannot be empty")
+    client_id = request.client.host if request.client else "unknown"
+    async with admission.admit(client_id):
+        yield text
@@ -0,0 +1,116 @@
+"""Module providing cache warm-start from historical request logs.
+
+After a deploy or restart the translation and clip caches are empty. The `app_logs` table records the full URL of
+every `/videos/process-text/` request, so the most frequent recent inputs can be pre-translated (under a rate limit)
+and their clips preloaded before users ask for them. Warm-up resolves clips without updating the resolution
+metrics, so synthetic traffic is not reported as user traffic.
+
+Functions:
+- top_inputs: Returns the most frequent recent `/videos/process-text/` inputs from the request logs.
+- warm_caches: Pre-translates the top inputs and preloads the clips they resolve to.
+- run_warmup_loop: Runs `warm_caches` at startup and then every `settings.cache_warmup_interval_hours`.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+from database.database import AppLog, SessionLocal
+from helpers.clip_cache import clip_cache
+from helpers.video_service import resolve_clip_names
+from utils.config import settings
+from utils.gemini_client import GeminiClient, GeminiUnavailableError
+
+logger = logging.getLogger(__name__)
+
+PROCESS_TEXT_PATH = "/videos/process-text/"
+
+
+def top_inputs(limit: int, window_hours: float, scan_limit: int = 10000) -> List[str]:
+    """Return the most frequent recent inputs of successful `/videos/process-text/` requests.
+
+    Args:
+        limit (int): Maximum number of inputs to return.
+        window_hours (float): Only consider requests logged within this many hours.
+        scan_limit (int): Maximum number of recent log rows to scan.
+
+    Returns:
+        List[str]: Inputs ordered by descending frequency, compared case- and whitespace-insensitively.
+    """
+    since = datetime.now() - timedelta(hours=window_hours)
+    with SessionLocal() as db:
+        rows = (
+            db.query(AppLog.path)
+            .filter(
+                AppLog.path.like(f"%{PROCESS_TEXT_PATH}?%"),
+                AppLog.status_code < 400,
+                AppLog.timestamp >= since,
+            )
+            .order_by(AppLog.id.desc())
+            .limit(scan_limit)
+            .all()
+        )
+
+    counts: Counter = Counter()
+    originals: Dict[str, str] = {}
+    for (path,) in rows:
+        texts = parse_qs(urlsplit(path).query).get("text")
+        if not texts or not texts[0].strip():
+            continue
+        key = " ".join(texts[0].lower().split())
+        counts[key] += 1
+        # Rows are newest first, so the most recent spelling of each input is kept
+        originals.setdefault(key, texts[0].strip())
+    return [originals[key] for key, _ in counts.most_common(limit)]
+
+
+async def warm_caches(
+    limit: int = settings.cache_warmup_top_n,
+    window_hours: float = settings.cache_warmup_window_hours,
+    rate: float = settings.cache_warmup_rate,
+) -> Dict[str, int]:
+    """Pre-translate the most frequent recent inputs and preload the clips they resolve to.
+
+    Args:
+        limit (int): Number of inputs to pre-translate.
+        window_hours (float): How far back in the request logs to look.
+        rate (float): Maximum pre-translations per second.
+
+    Returns:
+        Dict[str, int]: Number of inputs found, inputs translated, and clips resident after preloading.
+    """
+    inputs = await asyncio.to_thread(top_inputs, limit, window_hours)
+    clip_counts: Counter = Counter()
+    translated = 0
+    client = GeminiClient()
+
+    for i, text in enumerate(inputs):
+        if i and rate > 0:
+            await asyncio.sleep(1 / rate)
+        try:
+            generated_text = await client.generate_text(prompt=text)
+        except GeminiUnavailableError as e:
+            logger.warning(f"Cache warm-up failed for input {text!r}: {e}")
+            continue
+        translated += 1
+        # Inputs are ordered by frequency, so earlier inputs weigh more
+        for clip in resolve_clip_names(generated_text):
+            clip_counts[clip] += len(inputs) - i
+
+    resident = await clip_cache.preload(name for name, _ in clip_counts.most_common())
+    logger.info(f"Cache warm-up translated {translated}/{len(inputs)} inputs, {resident} clips resident")
+    return {"inputs": len(inputs), "translated": translated, "resident_clips": resident}
+
+
+async def run_warmup_loop() -> None:
+    """Warm the caches now and then every `settings.cache_warmup_interval_hours` hours (if set)."""
+    while True:
+        try:
+            await warm_caches()
+        except Exception as e:
+            logger.error(f"Cache warm-up failed: {e}")
+        if settings.cache_warmup_interval_hours <= 0:
+            return
+        await asyncio.sleep(settings.cache_warmup_interval_hours * 60 * 60)
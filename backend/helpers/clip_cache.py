@@ -0,0 +1,263 @@
+"""Module providing the in-memory clip cache.
+
+The whole sign vocabulary is small (about 15 MB) and a few dozen clips make up most requests, so clip bytes are kept
+in a byte-budgeted LRU store and served from memory instead of being stat'ed and read from disk on every request.
+Responses slice the cached buffers through `memoryview`, so byte-range requests do not copy clip data. Each clip
+keeps the `ETag`/`Last-Modified` validators of the file it was read from, so conditional requests can be answered
+without touching the disk. Resident clips are re-stat'ed at most once per refresh interval and dropped when the file
+changed or disappeared, so replaced clips are picked up without a restart.
+
+Classes:
+- ClipCache: Byte-budgeted LRU store of clip file contents with per-clip hit statistics.
+
+Functions:
+- parse_range: Parses a single HTTP `Range` header into an inclusive byte range.
+- etag_matches: Checks an `If-None-Match`/`If-Range` header against an ETag.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ClipCache:
+    """Byte-budgeted LRU store of clip file contents.
+
+    Clip names are matched case-insensitively against the files in `video_dir`, so the lowercase paths returned
+    by `get_video_path` resolve to the capitalized files on disk.
+
+    Attributes:
+        video_dir (Path): Directory holding the `.mp4` clips.
+        budget_bytes (int): Maximum number of clip bytes kept in memory.
+        used_bytes (int): Number of clip bytes currently kept in memory.
+        stats (Dict[str, Dict[str, int]]): Per-clip `hits`, `misses` and `bytes_served` counters.
+        refresh_interval (float): Minimum seconds between directory rescans triggered by unknown clip names, and
+            between checks that a resident clip still matches its file.
+
+    Example:
+        >>> cache = ClipCache(settings.video_dir, 32 * 1024 * 1024)
+        >>> data = await cache.get('hello')
+        >>> len(data)
+        104857
+    """
+
+    def __init__(self, video_dir: Path, budget_bytes: int, refresh_interval: float = 5.0):
+        self.video_dir = Path(video_dir)
+        self.budget_bytes = budget_bytes
+        self.refresh_interval = refresh_interval
+        self.used_bytes = 0
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._clips: "OrderedDict[str, bytes]" = OrderedDict()
+        self._validators: Dict[str, Tuple[str, str]] = {}
+        self._signatures: Dict[str, Tuple[Path, Tuple[int, int], float]] = {}
+        self._files: Dict[str, Path] = {}
+        self._files_refreshed_at: Optional[float] = None
+
+    def _refresh_files(self) -> None:
+        self._files = {p.stem.lower(): p for p in self.video_dir.glob("*.mp4")}
+        self._files_refreshed_at = time.monotonic()
+
+    def resolve(self, name: str) -> Optional[Path]:
+        """Return the clip file for a case-insensitive clip name, or None if it does not exist.
+
+        Unknown names rescan the directory at most once every `refresh_interval` seconds, so requests for
+        missing clips do not glob the directory each time.
+        """
+        key = name.lower()
+        if key not in self._files and (
+            self._files_refreshed_at is None
+            or time.monotonic() - self._files_refreshed_at >= self.refresh_interval
+        ):
+            self._refresh_files()
+        return self._files.get(key)
+
+    def validators(self, name: str) -> Optional[Tuple[str, str]]:
+        """Return the (ETag, Last-Modified) pair of a clip that has been read, or None."""
+        return self._validators.get(name.lower())
+
+    def _read(self, key: str, path: Path) -> bytes:
+        stat = path.stat()
+        data = path.read_bytes()
+        self._validators[key] = (
+            f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+            formatdate(stat.st_mtime, usegmt=True),
+        )
+        self._signatures[key] = (path, (stat.st_size, stat.st_mtime_ns), time.monotonic())
+        return data
+
+    def _is_stale(self, key: str) -> bool:
+        """Return True if a resident clip's file changed or disappeared, checking at most once per interval."""
+        path, signature, checked_at = self._signatures[key]
+        now = time.monotonic()
+        if now - checked_at < self.refresh_interval:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return True
+        if (stat.st_size, stat.st_mtime_ns) != signature:
+            return True
+        self._signatures[key] = (path, signature, now)
+        return False
+
+    def _evict(self, key: str) -> None:
+        data = self._clips.pop(key, None)
+        if data is not None:
+            self.used_bytes -= len(data)
+        self._validators.pop(key, None)
+        self._signatures.pop(key, None)
+        # The file may have been renamed or removed, so look it up again on the next miss
+        self._files.pop(key, None)
+        self._files_refreshed_at = None
+
+    async def get(self, name: str) -> Optional[memoryview]:
+        """Return the clip bytes for `name`, reading and admitting the file on a miss.
+
+        Args:
+            name (str): Clip name without extension, matched case-insensitively.
+
+        Returns:
+            Optional[memoryview]: A read-only view over the clip bytes, or None if the clip does not exist.
+        """
+        key = name.lower()
+        data = self._clips.get(key)
+        if data is not None and self._is_stale(key):
+            logger.info(f"Clip '{name}' changed on disk, dropping cached copy")
+            self._evict(key)
+            data = None
+        if data is not None:
+            self._clips.move_to_end(key)
+            self._stats_for(key)["hits"] += 1
+            return memoryview(data)
+
+        path = self.resolve(name)
+        if path is None:
+            return None
+        try:
+            data = await asyncio.to_thread(self._read, key, path)
+        except OSError as e:
+            logger.warning(f"Could not read clip {path}: {e}")
+            self._evict(key)
+            return None
+        self._stats_for(key)["misses"] += 1
+        self._admit(key, data)
+        return memoryview(data)
+
+    def record_served(self, name: str, num_bytes: int) -> None:
+        self._stats_for(name.lower())["bytes_served"] += num_bytes
+
+    async def preload(self, names: Optional[Iterable[str]] = None) -> int:
+        """Load clips into memory, keeping the highest-priority clips when the budget is too small.
+
+        Clips are admitted from lowest to highest priority, so the most important ones end up most recently
+        used and any eviction drops the least important clips first.
+
+        Args:
+            names (Optional[Iterable[str]]): Clip names in priority order. Defaults to every clip in `video_dir`.
+
+        Returns:
+            int: Number of clips resident after preloading.
+        """
+        self._refresh_files()
+        for name in reversed(list(names if names is not None else sorted(self._files))):
+            key = name.lower()
+            path = self._files.get(key)
+            if path is None:
+                continue
+            if key in self._clips:
+                self._clips.move_to_end(key)
+                continue
+            self._admit(key, await asyncio.to_thread(self._read, key, path))
+        logger.info(f"Clip cache preloaded {len(self._clips)} clips ({self.used_bytes} bytes)")
+        return len(self._clips)
+
+    def _admit(self, key: str, data: bytes) -> None:
+        if len(data) > self.budget_bytes:
+            return
+        if key in self._clips:
+            self.used_bytes -= len(self._clips.pop(key))
+        while self._clips and self.used_bytes + len(data) > self.budget_bytes:
+            _, evicted = self._clips.popitem(last=False)
+            self.used_bytes -= len(evicted)
+        self._clips[key] = data
+        self.used_bytes += len(data)
+
+    def _stats_for(self, key: str) -> Dict[str, int]:
+        return self.stats.setdefault(key, {"hits": 0, "misses": 0, "bytes_served": 0})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return budget usage, overall hit ratio and per-clip statistics sorted by hits."""
+        hits = sum(s["hits"] for s in self.stats.values())
+        misses = sum(s["misses"] for s in self.stats.values())
+        clips = {
+            key: {**s, "resident": key in self._clips, "size": len(self._clips.get(key, b""))}
+            for key, s in sorted(self.stats.items(), key=lambda item: item[1]["hits"], reverse=True)
+        }
+        return {
+            "budget_bytes": self.budget_bytes,
+            "used_bytes": self.used_bytes,
+            "resident_clips": len(self._clips),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "clips": clips,
+        }
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single `bytes=` range header into an inclusive (start, end) tuple.
+
+    Args:
+        header (str): The raw `Range` header value.
+        size (int): Total size of the resource in bytes.
+
+    Returns:
+        Optional[Tuple[int, int]]: The inclusive byte range, or None if the header asks for several ranges and
+        the full resource should be served instead.
+
+    Raises:
+        ValueError: If the range is malformed or not satisfiable.
+
+    Example:
+        >>> parse_range('bytes=0-99', 1000)
+        (0, 99)
+        >>> parse_range('bytes=-100', 1000)
+        (900, 999)
+    """
+    match = re.fullmatch(r"\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*", header)
+    if match is None:
+        if header.strip().startswith("bytes=") and "," in header:
+            return None
+        raise ValueError(f"Malformed range: {header}")
+
+    first, last = match.groups()
+    if first == "" and last == "":
+        raise ValueError(f"Malformed range: {header}")
+    if first == "":
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, end
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Return True if an `If-None-Match`/`If-Range` header value matches `etag` (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    strip_weak = lambda tag: tag.strip().removeprefix("W/")
+    return any(strip_weak(tag) == strip_weak(etag) for tag in header.split(","))
+
+
+clip_cache = ClipCache(settings.video_dir, settings.clip_cache_budget)
+"""Process-wide clip cache used by the clip routes."""
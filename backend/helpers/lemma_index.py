@@ -0,0 +1,261 @@
+"""Module providing the morphological normalization index.
+
+The LLM output often contains inflected forms ("going", "asked", "beautifully") that have no exact clip in
+`settings.video_dir`. This module maps such surface forms to the clips that do exist using a light rule-based
+stemmer and a curated synonym table. The index is built offline and saved as JSON so that path resolution only
+does constant-time dictionary lookups at request time.
+
+Build or refresh the index after adding clips:
+
+    python -m helpers.lemma_index
+
+Functions:
+- stem: Reduces a word to its rule-based stem.
+- build_index: Builds the surface form and stem tables from the available clips.
+- write_index: Builds the index and writes it to `settings.lemma_index_path`.
+- get_index: Returns the loaded index, building it in memory if the JSON file is missing.
+- exact_clip: Returns the clip whose name matches a word case-insensitively, or None.
+- lookup: Returns the clip an inflected form or synonym stands for, or None.
+- get_stats: Returns how many words the index recovered.
+"""
+
+import json
+import logging
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+SUFFIX_RULES = [
+    ("ness", ""),
+    ("ies", "y"),
+    ("ied", "y"),
+    ("ily", "y"),
+    ("ingly", ""),
+    ("ing", ""),
+    ("edly", ""),
+    ("ed", ""),
+    ("ly", ""),
+    ("es", ""),
+    ("s", ""),
+]
+"""Ordered (suffix, replacement) rules; the first matching rule wins."""
+
+MIN_STEM_LENGTH = 3
+
+SYNONYMS: Dict[str, str] = {
+    # Irregular forms
+    "am": "Be",
+    "is": "Be",
+    "are": "Be",
+    "was": "Be",
+    "were": "Be",
+    "been": "Be",
+    "being": "Be",
+    "going": "Go",
+    "goes": "Go",
+    "went": "Go",
+    "gone": "Go",
+    "doing": "Do",
+    "does": "Do",
+    "did": "Do",
+    "done": "Do",
+    "ate": "Eat",
+    "eaten": "Eat",
+    "came": "Come",
+    "saw": "See",
+    "seen": "See",
+    "fought": "Fight",
+    "kept": "Keep",
+    "learnt": "Learn",
+    "sang": "Sing",
+    "sung": "Sing",
+    "spoke": "Talk",
+    "spoken": "Talk",
+    "said": "Talk",
+    # Contractions (apostrophes are stripped by input sanitization)
+    "cant": "Cannot",
+    "dont": "Do Not",
+    "doesnt": "Does Not",
+    "didnt": "Do Not",
+    "thanks": "Thank You",
+    # Derived forms the stemmer deliberately does not handle
+    "happiness": "Happy",
+    "word": "Words",
+    # Synonyms
+    "hi": "Hello",
+    "hey": "Hello",
+    "goodbye": "Bye",
+    "glad": "Happy",
+    "joyful": "Happy",
+    "unhappy": "Sad",
+    "speak": "Talk",
+    "say": "Talk",
+    "tell": "Talk",
+    "job": "Work",
+    "house": "Home",
+    "university": "College",
+    "laptop": "Computer",
+    "pc": "Computer",
+    "tv": "Television",
+    "complete": "Finish",
+    "end": "Finish",
+    "myself": "Self",
+    "mine": "My",
+    "lovely": "Beautiful",
+    "nice": "Good",
+    "fine": "Good",
+    "correct": "Right",
+    "incorrect": "Wrong",
+}
+"""Curated surface form -> clip name table; entries whose clip is missing are skipped at build time."""
+
+STEM_EXCEPTIONS = frozenset({
+    "business",  # busi-ness, not busy
+    "heres",  # here's
+    "timed",  # timed is not the noun time
+    "wholly",
+})
+"""Surface forms known to stem onto an unrelated clip; they are never resolved through the stem table."""
+
+_index: Optional[Dict[str, Dict[str, str]]] = None
+
+recovered: Counter = Counter()
+"""Number of times each surface form was recovered through the index."""
+
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^a-z0-9_-]", "", word.lower())
+
+
+def stem(word: str) -> str:
+    """Reduce a word to its rule-based stem.
+
+    Args:
+        word (str): The word to stem.
+
+    Returns:
+        str: The lowercase stem.
+
+    Example:
+        >>> stem('asked'), stem('running'), stem('beautifully')
+        ('ask', 'run', 'beautiful')
+    """
+    word = _normalize(word)
+    for suffix, replacement in SUFFIX_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= MIN_STEM_LENGTH:
+            word = word[: -len(suffix)] + replacement
+            if len(word) > MIN_STEM_LENGTH and word[-1] == word[-2] and word[-1] not in "aeiouls":
+                word = word[:-1]
+            break
+    if len(word) > MIN_STEM_LENGTH and word.endswith("e") and not word.endswith("ee"):
+        word = word[:-1]
+    return word
+
+
+def build_index(clips: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """Build the surface form and stem tables for the given clip names.
+
+    Args:
+        clips (Iterable[str]): Clip names without extension (e.g. 'Hello', 'Do Not').
+
+    Returns:
+        Dict[str, Dict[str, str]]: `forms` maps normalized surface forms and synonyms to clip names, `stems`
+        maps stems to clip names. Stems shared by several clips (e.g. 'Here' and 'Her') are ambiguous and left
+        out, so those clips are only reachable through their own surface forms.
+    """
+    clips = list(clips)
+    forms: Dict[str, str] = {}
+    stems: Dict[str, str] = {}
+
+    for clip in clips:
+        forms.setdefault(_normalize(clip), clip)
+
+    available = set(clips)
+    for surface, clip in SYNONYMS.items():
+        if clip in available:
+            forms.setdefault(surface, clip)
+
+    owners: Dict[str, set] = {}
+    for clip in clips:
+        owners.setdefault(stem(clip), set()).add(clip)
+    for key, owner in sorted(owners.items()):
+        if len(owner) == 1:
+            stems[key] = next(iter(owner))
+
+    return {"forms": forms, "stems": stems}
+
+
+def write_index(video_dir: Path = settings.video_dir, index_path: Path = settings.lemma_index_path) -> Dict[str, Dict[str, str]]:
+    """Build the index from the clips in `video_dir` and write it to `index_path` as JSON."""
+    index = build_index(p.stem for p in sorted(Path(video_dir).glob("*.mp4")))
+    Path(index_path).write_text(json.dumps(index, indent=2, sort_keys=True) + "\n")
+    return index
+
+
+def get_index() -> Dict[str, Dict[str, str]]:
+    """Return the lemma index, loading it from disk on first use."""
+    global _index
+    if _index is None:
+        index_path = Path(settings.lemma_index_path)
+        if index_path.exists():
+            _index = json.loads(index_path.read_text())
+        else:
+            logger.warning(f"Lemma index not found at {index_path}, building it in memory")
+            _index = build_index(p.stem for p in Path(settings.video_dir).glob("*.mp4"))
+    return _index
+
+
+def exact_clip(word: str) -> Optional[str]:
+    """Return the clip whose name matches `word` case-insensitively, or None.
+
+    Example:
+        >>> exact_clip('hello')
+        'Hello'
+    """
+    normalized = _normalize(word)
+    clip = get_index()["forms"].get(normalized)
+    if clip is not None and _normalize(clip) == normalized:
+        return clip
+    return None
+
+
+def lookup(word: str, record: bool = True) -> Optional[str]:
+    """Return the clip an inflected form or synonym stands for, or None if the index cannot recover it.
+
+    Words that name a clip directly are not recoveries; use `exact_clip` for them. Only actual recoveries are
+    counted in `recovered`, and only when `record` is True.
+
+    Example:
+        >>> lookup('going')
+        'Go'
+    """
+    normalized = _normalize(word)
+    if not normalized or exact_clip(normalized) is not None:
+        return None
+    index = get_index()
+    clip = index["forms"].get(normalized)
+    if clip is None and normalized not in STEM_EXCEPTIONS:
+        stemmed = stem(normalized)
+        # An uninflected word must not match another clip just because that clip stems onto it (tim -> Time)
+        if stemmed != normalized:
+            clip = index["stems"].get(stemmed)
+    if clip is not None and record:
+        recovered[normalized] += 1
+    return clip
+
+
+def get_stats(top: int = 20) -> Dict[str, object]:
+    """Return the total number of recovered words and the most frequently recovered surface forms."""
+    return {
+        "recovered": sum(recovered.values()),
+        "top_recovered": dict(recovered.most_common(top)),
+    }
+
+
+if __name__ == "__main__":
+    written = write_index()
+    print(f"Wrote {len(written['forms'])} forms and {len(written['stems'])} stems to {settings.lemma_index_path}")
@@ -7,6 +7,7 @@ Functions:
 - sanitize_input: Async middleware function to sanitize request data.
 """
 
+import json
 import re
 from fastapi import Request
 
@@ -45,7 +46,8 @@ async def sanitize_input(request: Request, call_next):
         try:
             body = await request.json()
             sanitized_body = sanitize(body)
-            request._body = sanitized_body
+            # Downstream handlers re-read the raw body, so it must stay JSON-encoded bytes
+            request._body = json.dumps(sanitized_body).encode()
         except Exception:
             pass
 
@@ -0,0 +1,122 @@
+"""
+Opt-in per-request profiling.
+
+When `settings.profile_token` is set, a request carrying a matching `X-Profile-Token` header is run under cProfile
+through the whole middleware stack (including `process_and_send_video` and the database log write). The trace is
+saved to `settings.profile_dir`, which is rotated to keep at most `settings.profile_max_files` traces. Without a
+configured token the middleware is not installed at all, so the mode costs nothing when off.
+
+Note that cProfile records everything running on the event loop thread while the request is in flight, so traces
+taken under concurrent load also contain other requests. Work run in executor threads (the Gemini SDK call) shows
+up as time spent waiting on the executor future.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import re
+import secrets
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from fastapi import Request
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile-Token"
+PROFILE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+\.prof$")
+ADMIN_PATH_PREFIX = "/admin/profiles"
+
+
+def is_authorized(token: Optional[str]) -> bool:
+    """Return True if profiling is enabled and `token` matches `settings.profile_token`."""
+    return bool(settings.profile_token) and token is not None and secrets.compare_digest(token, settings.profile_token)
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Return the saved traces, newest first."""
+    profile_dir = Path(settings.profile_dir)
+    if not profile_dir.exists():
+        return []
+    files = sorted(profile_dir.glob("*.prof"), key=lambda p: p.stat().st_mtime, reverse=True)
+    return [
+        {
+            "name": p.name,
+            "size": p.stat().st_size,
+            "created": datetime.fromtimestamp(p.stat().st_mtime).isoformat(),
+        }
+        for p in files
+    ]
+
+
+def get_profile_path(name: str) -> Optional[Path]:
+    """Return the path of a saved trace, or None if the name is invalid or the trace does not exist."""
+    if not PROFILE_NAME_PATTERN.match(name):
+        return None
+    path = Path(settings.profile_dir) / name
+    return path if path.is_file() else None
+
+
+def render_profile(path: Path, limit: int = 50) -> str:
+    """Render a saved trace as a pstats text report sorted by cumulative time."""
+    stream = io.StringIO()
+    pstats.Stats(str(path), stream=stream).sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue()
+
+
+def _rotate(profile_dir: Path) -> None:
+    files = sorted(profile_dir.glob("*.prof"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in files[settings.profile_max_files:]:
+        old.unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """Middleware that profiles requests carrying a valid profiling token."""
+
+    def __init__(self):
+        self._active = False
+
+    async def __call__(self, request: Request, call_next):
+        """
+        Profile the request if it carries a valid token, otherwise pass it through.
+
+        Args:
+            request: The incoming FastAPI request
+            call_next: The next middleware or route handler to call
+
+        Returns:
+            Response: The response from the next middleware or route handler, with an `X-Profile-Id` header
+            naming the saved trace when the request was profiled
+        """
+        # Only one cProfile profiler can be active per thread, and admin calls must not rotate away traces
+        if (
+            self._active
+            or request.url.path.startswith(ADMIN_PATH_PREFIX)
+            or not is_authorized(request.headers.get(PROFILE_HEADER))
+        ):
+            return await call_next(request)
+
+        self._active = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            response = await call_next(request)
+        finally:
+            profiler.disable()
+            self._active = False
+
+        try:
+            profile_dir = Path(settings.profile_dir)
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            slug = re.sub(r"[^A-Za-z0-9]+", "-", request.url.path).strip("-") or "root"
+            name = f"{datetime.now():%Y%m%dT%H%M%S}-{request.method}-{slug[:60]}-{uuid.uuid4().hex[:8]}.prof"
+            profiler.dump_stats(str(profile_dir / name))
+            _rotate(profile_dir)
+            response.headers["X-Profile-Id"] = name
+        except Exception as e:
+            logger.error(f"Failed to save request profile: {e}")
+
+        return response
@@ -4,21 +4,110 @@ This module contains functions to get video file paths based on words and to pro
 operations including generating sign language text and retrieving video paths.
 
 Functions:
-- get_video_path: Asynchronously gets the file path of a video corresponding to a given word.
+- get_video_path: Asynchronously gets the file path of a video corresponding to a given word, falling back to the
+  lemma index for inflected forms and synonyms.
+- resolve_clip_names: Resolves the words of a text to clip names without touching the resolution metrics.
+- resolve_video_paths: Asynchronously resolves many words to video paths, statuses and content hashes in one call.
+- get_content_hash: Returns the cached SHA-256 digest of a clip file.
+- get_resolution_stats: Returns counters of how words were resolved.
 - process_and_send_video: Asynchronously generates sign language text and retrieves video paths for each word in the GeminiClient response.
+  When Gemini is unavailable it degrades to a direct word-by-word lookup of the input text.
 """
 
 import asyncio
+import hashlib
 import re
 import logging
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 from fastapi import HTTPException
 from pathlib import Path
+from urllib.parse import quote
 from utils.config import settings
-from utils.gemini_client import GeminiClient
+from utils.gemini_client import GeminiClient, GeminiUnavailableError
+from helpers import lemma_index
 
 logger = logging.getLogger(__name__)
 
+resolution_counts: Counter = Counter()
+"""Number of words resolved exactly, recovered through the lemma index, or missing."""
+
+_content_hashes: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+
+def _clip_url_name(name: str) -> str:
+    """Return the lowercase, percent-encoded clip name used in video URLs (e.g. 'Do Not' -> 'do%20not')."""
+    return quote(name.lower())
+
+
+def _index_clip_path(clip: str) -> Optional[Path]:
+    """Return the file of a clip named by the lemma index, or None if the index is stale and the file is gone."""
+    video_path = Path(settings.video_dir) / f"{clip}.mp4"
+    if video_path.exists():
+        return video_path
+    logger.warning(f"Lemma index points to missing clip '{clip}'; rebuild it with `python -m helpers.lemma_index`")
+    return None
+
+
+def _resolve_word(word: str, record: bool = True) -> Tuple[str, Optional[Path], str]:
+    """Resolve a word to its clip without raising.
+
+    Args:
+        word (str): The word to search video for.
+        record (bool): Whether to update the resolution metrics; False for synthetic traffic such as warm-up.
+
+    Returns:
+        Tuple[str, Optional[Path], str]: The clip name, the clip file (None if missing) and the resolution
+        status: 'found' for an exact clip, 'fallback' for a lemma index match, or 'missing'. Index entries whose
+        file no longer exists count as 'missing'.
+    """
+    safe_word = re.sub(r"[^a-zA-Z0-9_-]", "", word)
+
+    # Use the full system path to check if file exists; clips are capitalized on disk, so also match
+    # case-insensitively through the index
+    video_path = Path(settings.video_dir) / f"{safe_word}.mp4"
+    if video_path.exists():
+        if record:
+            resolution_counts["exact"] += 1
+        return safe_word, video_path, "found"
+
+    clip = lemma_index.exact_clip(safe_word)
+    clip_path = _index_clip_path(clip) if clip is not None else None
+    if clip_path is not None:
+        if record:
+            resolution_counts["exact"] += 1
+        return clip, clip_path, "found"
+
+    clip = lemma_index.lookup(safe_word, record=record)
+    clip_path = _index_clip_path(clip) if clip is not None else None
+    if clip_path is not None:
+        if record:
+            resolution_counts["lemma"] += 1
+        return clip, clip_path, "fallback"
+
+    if record:
+        resolution_counts["missing"] += 1
+    return safe_word, None, "missing"
+
+
+def resolve_clip_names(text: str) -> List[str]:
+    """Return the clip names for the words in `text` without updating the resolution metrics.
+
+    Used for synthetic traffic such as cache warm-up, which must not be counted as user traffic.
+
+    Args:
+        text (str): Sign language text, e.g. a Gemini translation.
+
+    Returns:
+        List[str]: Clip names (e.g. 'Hello', 'Do Not') of the words that resolve to a clip, in order.
+    """
+    clips = []
+    for w in re.findall(r"\b\w+\b", text):
+        name, video_path, _ = _resolve_word(w, record=False)
+        if video_path is not None:
+            clips.append(name)
+    return clips
+
 
 async def get_video_path(word: str) -> str:
     """Get the relative file path of a video corresponding to a given word.
@@ -27,7 +116,8 @@ async def get_video_path(word: str) -> str:
         word (str): The word to search video for.
 
     Returns:
-        str: The relative file path to the video (e.g., 'videos/hello.mp4').
+        str: The relative file path to the video (e.g., 'videos/hello.mp4'). Inflected forms and synonyms
+        without an exact clip resolve to their lemma's clip (e.g. 'going' -> 'videos/go.mp4').
 
     Raises:
         HTTPException: If the video file does not exist.
@@ -37,22 +127,112 @@ async def get_video_path(word: str) -> str:
         >>> print(video_path)
         'videos/hello.mp4'
     """
-    safe_word = re.sub(r"[^a-zA-Z0-9_-]", "", word)
-
-    # Use the full system path to check if file exists
-    video_path = Path(settings.video_dir) / f"{safe_word}.mp4"
-    print(f"DEBUG: Looking for video file at: {video_path.resolve()}")
+    name, video_path, status = _resolve_word(word)
 
-    if video_path.exists():
-        print(f"DEBUG: Found video file at: {video_path.resolve()}")
+    if status == "missing":
+        logger.debug(f"Video file not found for word: {word}")
+        raise HTTPException(status_code=404, detail="Video not found")
 
-        # Return relative path in the format expected by tests and frontend
-        # Convert to forward slashes and use relative path format
-        relative_path = f"videos/{safe_word.lower()}.mp4"
-        return relative_path
+    if status == "fallback":
+        logger.debug(f"Recovered '{word}' as clip '{name}' via lemma index")
     else:
-        print(f"DEBUG: Video file not found: {video_path.resolve()}")
-        raise HTTPException(status_code=404, detail="Video not found")
+        logger.debug(f"Found video file at: {video_path.resolve()}")
+
+    # Return relative path in the format expected by tests and frontend
+    return f"videos/{_clip_url_name(name)}.mp4"
+
+
+def get_content_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a clip file, cached until the file changes.
+
+    Args:
+        path (Path): The clip file.
+
+    Returns:
+        str: The hex digest of the file contents.
+    """
+    stat = path.stat()
+    cached = _content_hashes.get(path)
+    if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        return cached[1]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _content_hashes[path] = ((stat.st_mtime_ns, stat.st_size), digest)
+    return digest
+
+
+async def resolve_video_paths(words: List[str]) -> Dict[str, Any]:
+    """Resolve many words to video paths in one call, with the same semantics as `get_video_path`.
+
+    Each distinct word is resolved and each distinct clip hashed only once, so long or repetitive inputs stay
+    cheap. Hashing reads clip files, so it runs in worker threads to keep the event loop free; a clip that cannot
+    be read is reported as missing instead of failing the whole batch.
+
+    Args:
+        words (List[str]): The words to resolve, in order.
+
+    Returns:
+        Dict[str, Any]: `results` holds one entry per input word with its `video_path` (None if missing),
+        `status` ('found', 'fallback' or 'missing') and `content_hash` (None if missing); `found`, `fallback`
+        and `missing` count the statuses.
+
+    Example:
+        >>> result = await resolve_video_paths(['hello', 'going', 'xyz'])
+        >>> [r['status'] for r in result['results']]
+        ['found', 'fallback', 'missing']
+    """
+    resolved: Dict[str, Tuple[str, Optional[Path], str]] = {}
+    for word in words:
+        if word not in resolved:
+            resolved[word] = _resolve_word(word)
+
+    paths = list({video_path for _, video_path, _ in resolved.values() if video_path is not None})
+    digests = await asyncio.gather(
+        *(asyncio.to_thread(get_content_hash, path) for path in paths), return_exceptions=True
+    )
+    hashes: Dict[Path, str] = {}
+    for path, digest in zip(paths, digests):
+        if isinstance(digest, OSError):
+            # The clip disappeared after it was resolved; report it as missing rather than failing the batch
+            logger.warning(f"Could not hash clip {path}: {digest}")
+        elif isinstance(digest, BaseException):
+            raise digest
+        else:
+            hashes[path] = digest
+
+    results: List[Dict[str, Any]] = []
+    counts: Counter = Counter()
+    for word in words:
+        name, video_path, status = resolved[word]
+        if video_path is not None and video_path not in hashes:
+            video_path, status = None, "missing"
+        results.append({
+            "word": word,
+            "video_path": f"/videos/{_clip_url_name(name)}.mp4" if video_path is not None else None,
+            "status": status,
+            "content_hash": hashes.get(video_path),
+        })
+        counts[status] += 1
+
+    return {
+        "results": results,
+        "found": counts["found"],
+        "fallback": counts["fallback"],
+        "missing": counts["missing"],
+    }
+
+
+def get_resolution_stats() -> Dict[str, Any]:
+    """Return how many words were resolved exactly, recovered by the lemma index, or missing.
+
+    Returns:
+        Dict[str, Any]: Resolution counters plus the most frequently recovered surface forms.
+    """
+    return {
+        "exact": resolution_counts["exact"],
+        "lemma": resolution_counts["lemma"],
+        "missing": resolution_counts["missing"],
+        **lemma_index.get_stats(),
+    }
 
 
 async def process_and_send_video(text: str) -> Dict[str, Any]:
@@ -62,16 +242,23 @@ async def process_and_send_video(text: str) -> Dict[str, Any]:
         text (str): The input text (word or sentence) to generate sign language text for.
 
     Returns:
-        Dict[str, Any]: Dictionary containing the generated text and a list of video file paths.
+        Dict[str, Any]: Dictionary containing the generated text, a list of video file paths and a `degraded`
+        flag that is True when Gemini was unavailable and the input text was looked up word by word.
 
     Example:
         >>> result = await process_and_send_video('hello world')
         >>> print(result)
-        {'generated_text': '...', 'video_paths': ['videos/hello.mp4', 'videos/world.mp4']}
+        {'generated_text': '...', 'video_paths': ['videos/hello.mp4', 'videos/world.mp4'], 'degraded': False}
     """
-    # Generate text using GeminiClient
+    # Generate text using GeminiClient, falling back to the raw input if it is unavailable
     client = GeminiClient()
-    generated_text = await client.generate_text(prompt=text)
+    degraded = False
+    try:
+        generated_text = await client.generate_text(prompt=text)
+    except GeminiUnavailableError as e:
+        logger.warning(f"Gemini unavailable, using direct vocabulary lookup: {e}")
+        generated_text = text
+        degraded = True
 
     # Extract words from generated text
     words = re.findall(r"\b\w+\b", generated_text)
@@ -85,7 +272,7 @@ async def process_and_send_video(text: str) -> Dict[str, Any]:
             logger.warning(f"Video not found for word: {w}")
             continue
 
-    return {"generated_text": generated_text, "video_paths": video_paths}
+    return {"generated_text": generated_text, "video_paths": video_paths, "degraded": degraded}
 
 
 # Local offline test function
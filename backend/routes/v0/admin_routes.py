@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+from typing import Any, Dict, List, Optional
+import logging
+from helpers.profiling import PROFILE_HEADER, get_profile_path, is_authorized, list_profiles, render_profile
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def require_profile_token(token: Optional[str] = Header(None, alias=PROFILE_HEADER)) -> None:
+    """Reject requests without a valid profiling token.
+
+    Raises:
+        HTTPException: 404 if profiling is disabled, 403 if the token is missing or wrong.
+    """
+    if not settings.profile_token:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not is_authorized(token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_profile_token)],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/profiles", response_model=List[Dict[str, Any]])
+async def list_profiles_endpoint() -> List[Dict[str, Any]]:
+    """List saved request profiles, newest first.
+
+    Returns:
+        List of dictionaries with the trace name, size in bytes and creation time.
+    """
+    return list_profiles()
+
+@router.get("/profiles/{name}")
+async def get_profile_endpoint(
+    name: str,
+    format: str = Query("prof", pattern="^(prof|text)$", description="'prof' for the raw cProfile file, 'text' for a pstats report"),
+):
+    """Download a saved request profile.
+
+    Args:
+        name: The trace name as returned by the list endpoint or the `X-Profile-Id` response header.
+        format: 'prof' to download the raw cProfile file, 'text' for a pstats report sorted by cumulative time.
+
+    Returns:
+        The trace file or its text report.
+
+    Raises:
+        HTTPException: 404 if the trace does not exist.
+    """
+    path = get_profile_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "text":
+        return PlainTextResponse(render_profile(path))
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
@@ -0,0 +1,96 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from typing import Dict, Any
+from email.utils import parsedate_to_datetime
+import logging
+from helpers.clip_cache import clip_cache, etag_matches, parse_range
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/videos",
+    tags=["clips"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/metrics/clips", response_model=Dict[str, Any])
+async def clip_metrics_endpoint() -> Dict[str, Any]:
+    """Get clip cache statistics.
+
+    Returns:
+        Dictionary containing budget usage, the overall hit ratio and per-clip hits, misses and bytes served.
+    """
+    return clip_cache.get_stats()
+
+@router.api_route("/{clip_name}.mp4", methods=["GET", "HEAD"])
+async def serve_clip_endpoint(clip_name: str, request: Request) -> Response:
+    """Serve a clip from the in-memory clip cache.
+
+    Supports single byte-range requests so browsers can seek within a clip, and conditional requests
+    (`If-None-Match`, `If-Modified-Since`, `If-Range`) so returning browsers can reuse their cached copy.
+
+    Args:
+        clip_name: The clip name without extension, matched case-insensitively.
+        request: The incoming request, used for the `Range` and conditional headers.
+
+    Returns:
+        The full clip (200), the requested byte range (206) or Not Modified (304).
+
+    Raises:
+        HTTPException: 404 if the clip does not exist, 416 if the range is not satisfiable.
+    """
+    data = await clip_cache.get(clip_name)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Video not found")
+
+    etag, last_modified = clip_cache.validators(clip_name)
+    headers = {"Accept-Ranges": "bytes", "ETag": etag, "Last-Modified": last_modified}
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    size = len(data)
+    status_code = 200
+    byte_range = None
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range validator means the client's partial copy is outdated, so send the full clip
+    if range_header and if_range and not (etag_matches(if_range, etag) or if_range.strip() == last_modified):
+        range_header = None
+    if range_header:
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            raise HTTPException(
+                status_code=416,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+
+    if byte_range is not None:
+        start, end = byte_range
+        data = data[start : end + 1]
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(data))
+        return Response(status_code=status_code, headers=headers, media_type="video/mp4")
+
+    clip_cache.record_served(clip_name, len(data))
+    return Response(content=data, status_code=status_code, headers=headers, media_type="video/mp4")
+
+
+def _not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """Return True if the request's conditional headers show the client already has this version."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
+    return False
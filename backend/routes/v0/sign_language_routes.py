@@ -1,8 +1,12 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from typing import Dict, Any, List, Optional
 import logging
-from helpers.video_service import get_video_path, process_and_send_video
+import re
+from helpers.video_service import get_video_path, get_resolution_stats, process_and_send_video, resolve_video_paths
+from helpers.admission import admission, llm_admission
 import os
+from utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +16,11 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+class BatchPathRequest(BaseModel):
+    """Request body for batch word-to-path resolution; give either `words` or raw gloss `text`."""
+    words: Optional[List[str]] = None
+    text: Optional[str] = None
+
 @router.get("/path/{word}", response_model=Dict[str, str])
 async def get_video_path_endpoint(word: str) -> Dict[str, str]:
     """Get the video path for a specific word.
@@ -35,8 +44,55 @@ async def get_video_path_endpoint(word: str) -> Dict[str, str]:
         logger.error(f"Unexpected error getting video path: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/paths", response_model=Dict[str, Any])
+async def batch_video_paths_endpoint(request: BatchPathRequest) -> Dict[str, Any]:
+    """Resolve many words to video paths in one request.
+
+    Args:
+        request: Either a list of words or raw gloss text, which is split into words.
+
+    Returns:
+        Dictionary containing:
+            - results: One entry per word with its video_path, status ('found', 'fallback' or 'missing')
+              and content_hash
+            - found, fallback, missing: Number of words with each status
+
+    Raises:
+        HTTPException: 422 if neither or both of words and text are given, or there are too many words
+    """
+    if (request.words is None) == (request.text is None):
+        raise HTTPException(status_code=422, detail="Provide exactly one of 'words' or 'text'")
+
+    words = request.words if request.words is not None else re.findall(r"\b\w+\b", request.text)
+    if len(words) > settings.batch_max_words:
+        raise HTTPException(status_code=422, detail=f"At most {settings.batch_max_words} words per request")
+
+    return await resolve_video_paths(words)
+
+@router.get("/metrics/resolution", response_model=Dict[str, Any])
+async def resolution_metrics_endpoint() -> Dict[str, Any]:
+    """Get word-to-clip resolution metrics.
+
+    Returns:
+        Dictionary containing:
+            - exact: Words that matched a clip file directly
+            - lemma: Words recovered through the lemma index
+            - missing: Words without any clip
+            - top_recovered: Most frequently recovered surface forms
+    """
+    return get_resolution_stats()
+
+@router.get("/metrics/admission", response_model=Dict[str, Any])
+async def admission_metrics_endpoint() -> Dict[str, Any]:
+    """Get admission control metrics for the process-text endpoint.
+
+    Returns:
+        Dictionary containing the queue depth, in-flight requests and admitted/shed counters.
+    """
+    return admission.get_stats()
+
 @router.get("/process-text/", response_model=Dict[str, Any])
-async def process_text_endpoint(text: str = Query(..., description="Text to process into sign language videos", min_length=1)) -> Dict[str, Any]:
+async def process_text_endpoint(text: str = Depends(llm_admission)) -> Dict[str, Any]:
     """Process text into sign language videos.
     
     Args:
@@ -49,6 +105,8 @@ async def process_text_endpoint(text: str = Query(..., description="Text to proc
             
     Raises:
         HTTPException: 422 if input validation fails
+        HTTPException: 429 if the client exceeded its rate limit
+        HTTPException: 503 if the server is too busy to start the request in time
     """
     """Process text into sign language videos.
     
@@ -62,11 +120,10 @@ async def process_text_endpoint(text: str = Query(..., description="Text to proc
             
     Raises:
         HTTPException: 422 if input validation fails
+        HTTPException: 429 if the client exceeded its rate limit
+        HTTPException: 503 if the server is too busy to start the request in time
         HTTPException: 500 if there's an error processing the request
     """
-    if not text.strip():
-        raise HTTPException(status_code=422, detail="Input text cannot be empty")
-    
     try:
         result = await process_and_send_video(text)
         return result
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, patch
+from app import app
+from helpers import admission as admission_module
+from helpers.admission import AdmissionController
+
+client = TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rejects_with_retry_after():
+    controller = AdmissionController(rate=0.5, burst=1, max_concurrency=4, max_queue=4, max_wait=1.0)
+    async with controller.admit("client-a"):
+        pass
+
+    with pytest.raises(HTTPException) as exc_info:
+        async with controller.admit("client-a"):
+            pass
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers["Retry-After"] == "2"
+
+    async with controller.admit("client-b"):
+        pass
+    assert controller.get_stats()["shed"] == {"rate_limited": 1}
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_sheds_when_full_or_too_slow():
+    controller = AdmissionController(rate=100, burst=100, max_concurrency=1, max_queue=1, max_wait=0.1)
+    release = asyncio.Event()
+
+    async def hold_slot():
+        async with controller.admit("a"):
+            await release.wait()
+
+    holder = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+
+    async def wait_for_slot():
+        async with controller.admit("b"):
+            pass
+
+    waiter = asyncio.create_task(wait_for_slot())
+    await asyncio.sleep(0)
+    assert controller.get_stats()["queue_depth"] == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        async with controller.admit("c"):
+            pass
+    assert exc_info.value.status_code == 503
+
+    with pytest.raises(HTTPException) as exc_info:
+        await waiter
+    assert exc_info.value.status_code == 503
+    assert "Retry-After" in exc_info.value.headers
+
+    release.set()
+    await holder
+    assert controller.get_stats()["shed"] == {"queue_full": 1, "queue_timeout": 1}
+    assert controller.get_stats()["in_flight"] == 0
+
+
+def test_process_text_is_rate_limited_but_path_lookup_is_not(monkeypatch):
+    controller = AdmissionController(rate=0.01, burst=1, max_concurrency=4, max_queue=4, max_wait=1.0)
+    monkeypatch.setattr(admission_module, "admission", controller)
+
+    with patch("routes.v0.sign_language_routes.process_and_send_video", new_callable=AsyncMock) as mock_process:
+        mock_process.return_value = {"generated_text": "HELLO", "video_paths": [], "degraded": False}
+        assert client.get("/videos/process-text/", params={"text": "hello"}).status_code == 200
+        response = client.get("/videos/process-text/", params={"text": "hello"})
+
+    assert response.status_code == 429
+    assert "retry-after" in response.headers
+    for _ in range(3):
+        assert client.get("/videos/path/0").status_code == 200
+
+
+def test_invalid_process_text_requests_do_not_take_a_token(monkeypatch):
+    controller = AdmissionController(rate=0.01, burst=1, max_concurrency=4, max_queue=4, max_wait=1.0)
+    monkeypatch.setattr(admission_module, "admission", controller)
+
+    for params in ({}, {"text": ""}, {"text": "   "}):
+        assert client.get("/videos/process-text/", params=params).status_code == 422
+
+    with patch("routes.v0.sign_language_routes.process_and_send_video", new_callable=AsyncMock) as mock_process:
+        mock_process.return_value = {"generated_text": "HELLO", "video_paths": [], "degraded": False}
+        assert client.get("/videos/process-text/", params={"text": "hello"}).status_code == 200
+    assert controller.get_stats()["admitted"] == 1
@@ -0,0 +1,66 @@
+import hashlib
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app import app
+from helpers import video_service
+from helpers.video_service import resolve_video_paths
+from utils.config import settings
+
+client = TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_resolve_video_paths_reports_status_and_hash():
+    result = await resolve_video_paths(["0", "going", "xylophone", "0"])
+
+    assert [r["status"] for r in result["results"]] == ["found", "fallback", "missing", "found"]
+    assert result["results"][1]["video_path"] == "/videos/go.mp4"
+    assert result["results"][2]["video_path"] is None
+    assert result["results"][2]["content_hash"] is None
+    assert result["results"][0]["content_hash"] == hashlib.sha256((settings.video_dir / "0.mp4").read_bytes()).hexdigest()
+    assert (result["found"], result["fallback"], result["missing"]) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_resolve_video_paths_treats_case_variants_as_found():
+    result = await resolve_video_paths(["hello", "Hello", "dont"])
+
+    assert [r["status"] for r in result["results"]] == ["found", "found", "fallback"]
+    assert result["results"][0]["content_hash"] == result["results"][1]["content_hash"]
+    assert result["results"][2]["video_path"] == "/videos/do%20not.mp4"
+
+
+@pytest.mark.asyncio
+async def test_resolve_video_paths_reports_unreadable_clips_as_missing():
+    real_hash = video_service.get_content_hash
+
+    def flaky_hash(path):
+        if path.stem == "Hello":
+            raise FileNotFoundError(path)
+        return real_hash(path)
+
+    with patch("helpers.video_service.get_content_hash", side_effect=flaky_hash):
+        result = await resolve_video_paths(["hello", "0"])
+
+    assert result["results"][0] == {"word": "hello", "video_path": None, "status": "missing", "content_hash": None}
+    assert result["results"][1]["status"] == "found"
+    assert (result["found"], result["fallback"], result["missing"]) == (1, 0, 1)
+
+
+def test_batch_endpoint_accepts_words_or_text():
+    response = client.post("/videos/paths", json={"words": ["0", "going"]})
+    assert response.status_code == 200
+    assert [r["video_path"] for r in response.json()["results"]] == ["/videos/0.mp4", "/videos/go.mp4"]
+
+    response = client.post("/videos/paths", json={"text": "I going home!"})
+    assert response.status_code == 200
+    assert [r["word"] for r in response.json()["results"]] == ["I", "going", "home"]
+
+
+def test_batch_endpoint_validates_input(monkeypatch):
+    assert client.post("/videos/paths", json={}).status_code == 422
+    assert client.post("/videos/paths", json={"words": ["a"], "text": "a"}).status_code == 422
+
+    monkeypatch.setattr(settings, "batch_max_words", 2)
+    assert client.post("/videos/paths", json={"words": ["a", "b", "c"]}).status_code == 422
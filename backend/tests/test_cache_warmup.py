@@ -0,0 +1,62 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from database.database import AppLog, Base
+from helpers import cache_warmup
+from helpers.clip_cache import ClipCache
+from helpers.video_service import resolution_counts
+from utils.config import settings
+from utils.gemini_client import GeminiUnavailableError
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(cache_warmup, "SessionLocal", factory)
+
+    with factory() as db:
+        for path, status_code, age_hours in [
+            ("http://testserver/videos/process-text/?text=I+am+happy", 200, 1),
+            ("http://testserver/videos/process-text/?text=i%20AM%20happy", 200, 2),
+            ("http://testserver/videos/process-text/?text=good+morning", 200, 1),
+            ("http://testserver/videos/process-text/?text=broken", 500, 1),
+            ("http://testserver/videos/process-text/?text=old+input", 200, 100),
+            ("/videos/process-text/", 200, 1),
+        ]:
+            db.add(AppLog(method="GET", path=path, status_code=status_code, response_summary="",
+                          timestamp=datetime.now() - timedelta(hours=age_hours)))
+        db.commit()
+    return factory
+
+
+def test_top_inputs_ranks_recent_successful_inputs(session_factory):
+    assert cache_warmup.top_inputs(limit=10, window_hours=24) == ["i AM happy", "good morning"]
+    assert cache_warmup.top_inputs(limit=1, window_hours=24) == ["i AM happy"]
+
+
+@pytest.mark.asyncio
+async def test_warm_caches_translates_and_preloads_clips(session_factory, monkeypatch):
+    cache = ClipCache(settings.video_dir, budget_bytes=32 * 1024 * 1024)
+    monkeypatch.setattr(cache_warmup, "clip_cache", cache)
+    translations = {"i AM happy": "I HAPPY", "good morning": GeminiUnavailableError("down")}
+    before = resolution_counts.copy()
+
+    with patch("helpers.cache_warmup.GeminiClient") as mock_client_cls:
+        mock_client_cls.return_value.generate_text = AsyncMock(side_effect=lambda prompt: _translate(translations, prompt))
+        summary = await cache_warmup.warm_caches(limit=10, window_hours=24, rate=0)
+
+    assert summary == {"inputs": 2, "translated": 1, "resident_clips": 2}
+    assert cache.get_stats()["used_bytes"] > 0
+    assert resolution_counts == before
+
+
+def _translate(translations, prompt):
+    result = translations[prompt]
+    if isinstance(result, Exception):
+        raise result
+    return result
@@ -0,0 +1,107 @@
+import os
+import pytest
+from fastapi.testclient import TestClient
+from app import app
+from helpers.clip_cache import ClipCache, parse_range
+from utils.config import settings
+
+client = TestClient(app)
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=0-5000", 1000) == (0, 999)
+    assert parse_range("bytes=0-1,5-6", 1000) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=1000-", 1000)
+
+
+@pytest.mark.asyncio
+async def test_clip_cache_evicts_least_recently_used(tmp_path):
+    for name in ("A", "B", "C"):
+        (tmp_path / f"{name}.mp4").write_bytes(b"x" * 10)
+    cache = ClipCache(tmp_path, budget_bytes=20)
+
+    await cache.get("a")
+    await cache.get("b")
+    await cache.get("a")
+    await cache.get("c")
+
+    stats = cache.get_stats()
+    assert stats["used_bytes"] == 20
+    assert stats["clips"]["a"] == {"hits": 1, "misses": 1, "bytes_served": 0, "resident": True, "size": 10}
+    assert stats["clips"]["b"]["resident"] is False
+    assert await cache.get("missing") is None
+
+
+def test_serve_clip_full_and_range():
+    expected = (settings.video_dir / "Hello.mp4").read_bytes()
+
+    response = client.get("/videos/hello.mp4")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "video/mp4"
+    assert response.content == expected
+
+    response = client.get("/videos/hello.mp4", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 10-19/{len(expected)}"
+    assert response.content == expected[10:20]
+
+    response = client.get("/videos/hello.mp4", headers={"Range": f"bytes={len(expected)}-"})
+    assert response.status_code == 416
+
+
+def test_serve_clip_not_found():
+    assert client.get("/videos/nonexistentword.mp4").status_code == 404
+
+
+def test_serve_clip_conditional_requests():
+    response = client.get("/videos/hello.mp4")
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    response = client.get("/videos/hello.mp4", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert client.get("/videos/hello.mp4", headers={"If-Modified-Since": last_modified}).status_code == 304
+    assert client.get("/videos/hello.mp4", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    response = client.get("/videos/hello.mp4", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert response.status_code == 206
+    response = client.get("/videos/hello.mp4", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_unknown_clip_names_do_not_rescan_every_time(tmp_path):
+    cache = ClipCache(tmp_path, budget_bytes=20, refresh_interval=60)
+    assert await cache.get("late") is None
+
+    (tmp_path / "Late.mp4").write_bytes(b"x")
+    assert await cache.get("late") is None
+
+    cache.refresh_interval = 0
+    assert bytes(await cache.get("late")) == b"x"
+
+
+@pytest.mark.asyncio
+async def test_resident_clips_are_revalidated_against_disk(tmp_path):
+    clip = tmp_path / "Hello.mp4"
+    clip.write_bytes(b"old")
+    cache = ClipCache(tmp_path, budget_bytes=20, refresh_interval=60)
+    assert bytes(await cache.get("hello")) == b"old"
+    old_etag, _ = cache.validators("hello")
+
+    clip.write_bytes(b"newer")
+    os.utime(clip, ns=(clip.stat().st_atime_ns, clip.stat().st_mtime_ns + 10**9))
+    assert bytes(await cache.get("hello")) == b"old"
+
+    cache.refresh_interval = 0
+    assert bytes(await cache.get("hello")) == b"newer"
+    assert cache.validators("hello")[0] != old_etag
+    assert cache.used_bytes == 5
+
+    clip.unlink()
+    assert await cache.get("hello") is None
+    assert cache.used_bytes == 0
@@ -0,0 +1,161 @@
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+from utils import gemini_client
+from utils.config import settings
+from utils.gemini_client import CircuitBreaker, GeminiClient, GeminiUnavailableError, LatencyTracker, TranslationCache
+from helpers.video_service import process_and_send_video
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(gemini_client, "breaker", CircuitBreaker(2, 60.0))
+    monkeypatch.setattr(gemini_client, "translation_cache", TranslationCache(16, 60.0))
+    monkeypatch.setattr(settings, "gemini_backoff_base", 0.01)
+    with patch("utils.gemini_client.genai.Client"):
+        yield GeminiClient()
+
+
+@pytest.mark.asyncio
+async def test_generate_text_retries_until_success(client, monkeypatch):
+    calls = []
+
+    def flaky(prompt):
+        calls.append(prompt)
+        if len(calls) < 2:
+            raise RuntimeError("upstream error")
+        return "HELLO"
+
+    monkeypatch.setattr(client, "_generate_sync", flaky)
+    assert await client.generate_text("hello") == "HELLO"
+    assert len(calls) == 2
+    assert gemini_client.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_generate_text_uses_translation_cache(client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(client, "_generate_sync", lambda prompt: calls.append(prompt) or "I HAPPY")
+
+    assert await client.generate_text("I am happy") == "I HAPPY"
+    assert await client.generate_text("  i AM happy ") == "I HAPPY"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_text_respects_deadline(client, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_timeout", 0.2)
+    monkeypatch.setattr(client, "_generate_sync", lambda prompt: time.sleep(1) or "late")
+
+    start_time = time.monotonic()
+    with pytest.raises(GeminiUnavailableError, match="did not answer within"):
+        await client.generate_text("hello")
+    assert time.monotonic() - start_time < 0.5
+
+
+@pytest.mark.asyncio
+async def test_hung_attempt_is_retried_before_deadline(client, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_timeout", 1.0)
+    monkeypatch.setattr(settings, "gemini_max_retries", 2)
+    monkeypatch.setattr(settings, "gemini_attempt_timeout", 0.3)
+    calls = []
+
+    def hangs_once(prompt):
+        calls.append(prompt)
+        if len(calls) == 1:
+            time.sleep(2)
+        return "HELLO"
+
+    monkeypatch.setattr(client, "_generate_sync", hangs_once)
+    start_time = time.monotonic()
+    assert await client.generate_text("hello") == "HELLO"
+    assert len(calls) == 2
+    assert time.monotonic() - start_time < 1.0
+
+
+@pytest.mark.asyncio
+async def test_slow_attempt_is_not_abandoned_by_default(client, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_timeout", 1.0)
+    calls = []
+    monkeypatch.setattr(client, "_generate_sync", lambda prompt: calls.append(prompt) or time.sleep(0.5) or "HELLO")
+
+    assert await client.generate_text("hello") == "HELLO"
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def hedging(monkeypatch):
+    tracker = LatencyTracker(min_samples=5)
+    for _ in range(5):
+        tracker.record(0.05)
+    monkeypatch.setattr(gemini_client, "latencies", tracker)
+    monkeypatch.setattr(settings, "gemini_hedge_enabled", True)
+    monkeypatch.setattr(settings, "gemini_max_retries", 0)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_faster_result_wins(client, monkeypatch, hedging):
+    calls = []
+
+    def slow_first(prompt):
+        calls.append(prompt)
+        if len(calls) == 1:
+            time.sleep(1)
+            return "SLOW"
+        return "FAST"
+
+    monkeypatch.setattr(client, "_generate_sync", slow_first)
+    start_time = time.monotonic()
+    assert await client.generate_text("hello") == "FAST"
+    assert len(calls) == 2
+    assert time.monotonic() - start_time < 0.5
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_fails_when_both_requests_fail(client, monkeypatch, hedging):
+    calls = []
+
+    def failing(prompt):
+        calls.append(prompt)
+        if len(calls) == 1:
+            time.sleep(0.2)
+        raise RuntimeError("upstream error")
+
+    monkeypatch.setattr(client, "_generate_sync", failing)
+    with pytest.raises(GeminiUnavailableError) as excinfo:
+        await client.generate_text("hello")
+    assert len(calls) == 2
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_sustained_failures(client, monkeypatch):
+    monkeypatch.setattr(settings, "gemini_max_retries", 0)
+
+    def failing(prompt):
+        raise RuntimeError("outage")
+
+    monkeypatch.setattr(client, "_generate_sync", failing)
+    for _ in range(2):
+        with pytest.raises(GeminiUnavailableError, match="request failed: RuntimeError"):
+            await client.generate_text("hello")
+
+    assert gemini_client.breaker.state == "open"
+    with pytest.raises(GeminiUnavailableError, match="circuit breaker is open"):
+        await client.generate_text("hello")
+
+
+@pytest.mark.asyncio
+async def test_process_and_send_video_degrades_to_direct_lookup():
+    with (
+        patch("helpers.video_service.GeminiClient") as mock_client_cls,
+        patch("helpers.video_service.get_video_path", new_callable=AsyncMock) as mock_get,
+    ):
+        mock_client_cls.return_value.generate_text = AsyncMock(side_effect=GeminiUnavailableError("down"))
+        mock_get.side_effect = lambda w: f"videos/{w.lower()}.mp4"
+
+        result = await process_and_send_video("hello world")
+
+    assert result["degraded"] is True
+    assert result["generated_text"] == "hello world"
+    assert result["video_paths"] == ["videos/hello.mp4", "videos/world.mp4"]
@@ -0,0 +1,76 @@
+import json
+import pytest
+from fastapi import HTTPException
+from helpers import lemma_index
+from helpers.lemma_index import build_index, exact_clip, lookup, stem
+from helpers.video_service import get_video_path, resolution_counts
+from utils.config import settings
+
+
+def test_stem_strips_inflections():
+    assert stem("asked") == "ask"
+    assert stem("running") == "run"
+    assert stem("beautifully") == "beautiful"
+    assert stem("studies") == stem("Study")
+    assert stem("changing") == stem("Change")
+
+
+def test_build_index_drops_ambiguous_stems():
+    index = build_index(["Hand", "Hands", "Here", "Her", "Go"])
+    assert "hand" not in index["stems"]
+    assert "her" not in index["stems"]
+    assert index["forms"]["hands"] == "Hands"
+    assert index["forms"]["went"] == "Go"
+    assert "dont" not in index["forms"]  # synonym target clip is missing
+
+
+def test_lookup_recovers_inflected_forms_and_synonyms():
+    assert lookup("going") == "Go"
+    assert lookup("asked") == "Ask"
+    assert lookup("dont") == "Do Not"
+    assert lookup("didnt") == "Do Not"
+    assert lookup("xylophone") is None
+
+
+@pytest.mark.parametrize("word", ["business", "heres", "tim", "timed", "wholly"])
+def test_lookup_rejects_known_false_positives(word):
+    assert lookup(word) is None
+
+
+def test_exact_clips_are_not_counted_as_recoveries():
+    assert exact_clip("hello") == "Hello"
+    assert lookup("hello") is None
+    assert "hello" not in lemma_index.recovered
+
+
+@pytest.mark.asyncio
+async def test_get_video_path_counts_lowercase_words_as_exact():
+    before = resolution_counts.copy()
+    assert await get_video_path("hello") == "videos/hello.mp4"
+    assert resolution_counts["exact"] == before["exact"] + 1
+    assert resolution_counts["lemma"] == before["lemma"]
+
+
+@pytest.mark.asyncio
+async def test_get_video_path_uses_lemma_index():
+    assert await get_video_path("beautifully") == "videos/beautiful.mp4"
+    assert await get_video_path("dont") == "videos/do%20not.mp4"
+    with pytest.raises(HTTPException):
+        await get_video_path("xylophones")
+
+
+@pytest.mark.asyncio
+async def test_get_video_path_ignores_stale_index_entries(monkeypatch, tmp_path):
+    index_path = tmp_path / "lemma_index.json"
+    index = build_index(["Hello", "Ghost"])
+    index_path.write_text(json.dumps(index))
+    monkeypatch.setattr(settings, "lemma_index_path", index_path)
+    monkeypatch.setattr(lemma_index, "_index", None)
+
+    before = resolution_counts.copy()
+    with pytest.raises(HTTPException):
+        await get_video_path("ghost")
+    with pytest.raises(HTTPException):
+        await get_video_path("ghosts")
+    assert resolution_counts["missing"] == before["missing"] + 2
+    assert await get_video_path("hello") == "videos/hello.mp4"
@@ -0,0 +1,62 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from helpers.profiling import PROFILE_HEADER, ProfilingMiddleware
+from routes.v0.admin_routes import router as admin_router
+from utils.config import settings
+
+app = FastAPI()
+app.include_router(admin_router)
+app.middleware("http")(ProfilingMiddleware())
+
+
+@app.get("/work")
+async def work():
+    return {"total": sum(range(1000))}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def profiling_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "profile_token", "secret")
+    monkeypatch.setattr(settings, "profile_dir", tmp_path)
+    monkeypatch.setattr(settings, "profile_max_files", 2)
+
+
+def test_request_without_token_is_not_profiled(tmp_path):
+    response = client.get("/work", headers={PROFILE_HEADER: "wrong"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiled_request_is_listed_and_downloadable(tmp_path):
+    response = client.get("/work", headers={PROFILE_HEADER: "secret"})
+    name = response.headers["x-profile-id"]
+    assert (tmp_path / name).is_file()
+
+    listing = client.get("/admin/profiles", headers={PROFILE_HEADER: "secret"}).json()
+    assert [p["name"] for p in listing] == [name]
+
+    report = client.get(f"/admin/profiles/{name}", params={"format": "text"}, headers={PROFILE_HEADER: "secret"})
+    assert report.status_code == 200
+    assert "work" in report.text
+
+    raw = client.get(f"/admin/profiles/{name}", headers={PROFILE_HEADER: "secret"})
+    assert raw.content == (tmp_path / name).read_bytes()
+
+
+def test_profiles_are_rotated(tmp_path):
+    for _ in range(4):
+        client.get("/work", headers={PROFILE_HEADER: "secret"})
+    assert len(list(tmp_path.glob("*.prof"))) == 2
+
+
+def test_admin_endpoints_require_token(monkeypatch):
+    assert client.get("/admin/profiles").status_code == 403
+    assert client.get("/admin/profiles/../app_log.db", headers={PROFILE_HEADER: "secret"}).status_code == 404
+
+    monkeypatch.setattr(settings, "profile_token", "")
+    assert client.get("/admin/profiles", headers={PROFILE_HEADER: "secret"}).status_code == 404
@@ -8,7 +8,7 @@ Classes:
 - Settings: Configuration settings for the application.
 """
 
-from typing import List
+from typing import List, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -31,6 +31,36 @@ class Settings(BaseSettings):
         video_dir (Path): Absolute directory path where video files are stored. Defaults to 'assets'.
         gemini_api_key (str): API key for Gemini AI model.
         cors_origins (List[str]): List of allowed CORS origins.
+        gemini_timeout (float): Overall deadline in seconds for one Gemini translation, retries included.
+        gemini_max_retries (int): Number of retries after the first failed Gemini attempt.
+        gemini_attempt_timeout (Optional[float]): Timeout in seconds for a single Gemini attempt. Defaults to the
+            time left before `gemini_timeout`. A shorter value retries hung calls sooner, but a slow healthy call
+            is abandoned, keeps running, and is sent again, multiplying upstream load and quota use.
+        gemini_max_workers (int): Threads in the dedicated executor running blocking Gemini SDK calls.
+        gemini_backoff_base (float): Base delay in seconds for the jittered exponential backoff.
+        gemini_hedge_enabled (bool): Whether to send a duplicate request once the first one is slow.
+        gemini_hedge_percentile (float): Latency percentile (0-1) after which a hedged request is sent.
+        gemini_breaker_threshold (int): Consecutive failures that open the Gemini circuit breaker.
+        gemini_breaker_reset (float): Seconds the breaker stays open before allowing a trial call.
+        lemma_index_path (Path): JSON file holding the precomputed surface form -> clip index.
+        clip_cache_budget (int): Maximum number of clip bytes kept in the in-memory clip cache.
+        clip_cache_preload (bool): Whether to load clips into the clip cache at startup.
+        translation_cache_size (int): Maximum number of cached Gemini translations.
+        translation_cache_ttl (float): Seconds a cached Gemini translation stays valid.
+        cache_warmup_enabled (bool): Whether to warm the caches from the request logs at startup.
+        cache_warmup_top_n (int): Number of most frequent recent inputs to pre-translate.
+        cache_warmup_window_hours (float): How far back in the request logs to look for inputs.
+        cache_warmup_rate (float): Maximum pre-translations per second during warm-up.
+        cache_warmup_interval_hours (float): Hours between repeated warm-ups; 0 warms only at startup.
+        llm_rate_per_client (float): Sustained `/videos/process-text/` requests per second allowed per client.
+        llm_burst (int): Burst of `/videos/process-text/` requests allowed per client.
+        llm_max_concurrency (int): Maximum `/videos/process-text/` requests processed at once.
+        llm_max_queue (int): Maximum `/videos/process-text/` requests waiting for a free slot.
+        llm_max_queue_wait (float): Maximum seconds a request may wait for a free slot before being shed.
+        profile_token (str): Token enabling per-request profiling via the `X-Profile-Token` header; empty disables it.
+        profile_dir (Path): Directory where request profiles are saved.
+        profile_max_files (int): Maximum number of request profiles kept on disk.
+        batch_max_words (int): Maximum number of words accepted by the batch path endpoint.
 
     Note:
         With `extra = 'allow'` in the Config class, any other environment variables
@@ -48,6 +78,34 @@ class Settings(BaseSettings):
     video_dir: Path = BASE_DIR / "assets" / "videos"
     gemini_api_key: str
     cors_origins: List[str] = []
+    gemini_timeout: float = 8.0
+    gemini_max_retries: int = 2
+    gemini_attempt_timeout: Optional[float] = None
+    gemini_max_workers: int = 16
+    gemini_backoff_base: float = 0.25
+    gemini_hedge_enabled: bool = False
+    gemini_hedge_percentile: float = 0.95
+    gemini_breaker_threshold: int = 5
+    gemini_breaker_reset: float = 30.0
+    lemma_index_path: Path = BASE_DIR / "assets" / "lemma_index.json"
+    clip_cache_budget: int = 32 * 1024 * 1024
+    clip_cache_preload: bool = True
+    translation_cache_size: int = 1024
+    translation_cache_ttl: float = 24 * 60 * 60
+    cache_warmup_enabled: bool = False
+    cache_warmup_top_n: int = 50
+    cache_warmup_window_hours: float = 24.0
+    cache_warmup_rate: float = 2.0
+    cache_warmup_interval_hours: float = 0.0
+    llm_rate_per_client: float = 1.0
+    llm_burst: int = 10
+    llm_max_concurrency: int = 8
+    llm_max_queue: int = 32
+    llm_max_queue_wait: float = 2.0
+    profile_token: str = ""
+    profile_dir: Path = BASE_DIR / "log" / "profiles"
+    profile_max_files: int = 50
+    batch_max_words: int = 10000
 
     class Config:
         env_file = ".env"
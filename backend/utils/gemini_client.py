@@ -1,17 +1,192 @@
 """Module for interacting with the Google Gemini AI model.
 
 This module defines the GeminiClient class which wraps the Google GenAI SDK to generate sign language text from plain English sentences.
+Translations are kept in a bounded, TTL'd in-process cache. Every Gemini call is bounded by a deadline, retried
+with jittered backoff, optionally hedged with a duplicate request once it is slower than the usual latency
+percentile, and guarded by a process-wide circuit breaker.
+
+The Gemini SDK call is blocking and cannot be cancelled, so an attempt that times out keeps running in its thread
+until the upstream call returns. These calls run in a dedicated, bounded executor so that hung calls cannot starve
+the default executor used by `asyncio.to_thread` elsewhere (clip cache reads, cache warm-up). When every Gemini
+worker is stuck, new attempts wait in the executor queue until their per-attempt timeout and are then retried or
+reported as unavailable.
+
+Classes:
+- GeminiUnavailableError: Raised when Gemini cannot answer within the deadline or the breaker is open.
+- CircuitBreaker: Tracks consecutive failures and short-circuits calls during an outage.
+- LatencyTracker: Rolling window of successful call latencies used to pick the hedging delay.
+- TranslationCache: Bounded LRU of prompt -> generated text with a time-to-live.
 
 Functions:
 - GeminiClient.__init__: Initializes the GeminiClient with API key.
 - GeminiClient.generate_text: Asynchronously generates sign language text from a given English prompt.
 """
 
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Optional, Tuple
 from google import genai
 from utils.config import settings
 import asyncio
+import logging
+import random
+import time
 # Note: You need to have the google genai package installed and GOOGLE_API_KEY set
 
+logger = logging.getLogger(__name__)
+
+
+class GeminiUnavailableError(Exception):
+    """Raised when Gemini cannot produce a translation within the deadline."""
+
+
+class CircuitBreaker:
+    """Simple consecutive-failure circuit breaker.
+
+    The breaker is closed while calls succeed. After `failure_threshold` consecutive failures it opens and
+    rejects calls for `reset_timeout` seconds, then lets a single trial call through (half-open). A successful
+    trial closes it again, a failed one reopens it.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures needed to open the breaker.
+        reset_timeout (float): Seconds to stay open before allowing a trial call.
+        failures (int): Current number of consecutive failures.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Return 'closed', 'open' or 'half_open'."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted right now."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give back a half-open trial slot without counting a result (e.g. on cancellation)."""
+        self._trial_in_flight = False
+
+
+class LatencyTracker:
+    """Rolling window of successful Gemini call latencies in seconds."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the q-th (0-1) latency percentile, or None until enough samples are collected."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+
+class TranslationCache:
+    """Bounded LRU cache of Gemini translations with a time-to-live.
+
+    Prompts are keyed case- and whitespace-insensitively.
+
+    Attributes:
+        max_entries (int): Maximum number of cached translations.
+        ttl (float): Seconds a translation stays valid.
+        hits (int): Number of cache hits.
+        misses (int): Number of cache misses.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return " ".join(prompt.lower().split())
+
+    def get(self, prompt: str) -> Optional[str]:
+        key = self._key(prompt)
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, prompt: str, text: str) -> None:
+        key = self._key(prompt)
+        self._entries[key] = (time.monotonic(), text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, prompt: str) -> bool:
+        entry = self._entries.get(self._key(prompt))
+        return entry is not None and time.monotonic() - entry[0] <= self.ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+breaker = CircuitBreaker(settings.gemini_breaker_threshold, settings.gemini_breaker_reset)
+"""Process-wide breaker shared by every GeminiClient instance."""
+
+latencies = LatencyTracker()
+"""Process-wide latency window shared by every GeminiClient instance."""
+
+translation_cache = TranslationCache(settings.translation_cache_size, settings.translation_cache_ttl)
+"""Process-wide translation cache shared by every GeminiClient instance."""
+
+executor = ThreadPoolExecutor(max_workers=settings.gemini_max_workers, thread_name_prefix="gemini")
+"""Dedicated executor for blocking Gemini SDK calls, kept apart from the default executor."""
+
+
+def attempt_timeout(remaining: float) -> float:
+    """Return the timeout for one Gemini attempt given the seconds left before the deadline.
+
+    By default an attempt may use the whole remaining deadline, so a slow but healthy call is never abandoned and
+    resent (the abandoned call would keep running and add upstream load); hedging covers tail latency instead.
+    Setting `settings.gemini_attempt_timeout` caps each attempt so that a hung call is retried before the deadline.
+    """
+    if settings.gemini_attempt_timeout is not None:
+        return min(settings.gemini_attempt_timeout, remaining)
+    return remaining
+
 
 class GeminiClient:
     """Client for interacting with the Google Gemini AI model.
@@ -34,8 +209,91 @@ class GeminiClient:
         self.model_name = "gemini-2.0-flash"
 
     async def generate_text(self, prompt: str) -> str:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._generate_sync, prompt)
+        """Generate sign language text within `settings.gemini_timeout` seconds.
+
+        Cached translations are returned without calling Gemini. Each attempt is bounded by `attempt_timeout`;
+        failed or timed out attempts are retried with full-jitter exponential backoff as long as the deadline
+        allows it.
+
+        Raises:
+            GeminiUnavailableError: If the breaker is open or no attempt succeeded before the deadline.
+        """
+        cached = translation_cache.get(prompt)
+        if cached is not None:
+            return cached
+
+        if not breaker.allow_request():
+            raise GeminiUnavailableError("Gemini circuit breaker is open")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.gemini_timeout
+        last_error: Optional[BaseException] = None
+
+        try:
+            for attempt in range(settings.gemini_max_retries + 1):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    text = await asyncio.wait_for(
+                        self._attempt(prompt), timeout=attempt_timeout(remaining)
+                    )
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"Gemini attempt {attempt + 1} failed: {e!r}")
+                    backoff = random.uniform(0, settings.gemini_backoff_base * 2**attempt)
+                    if loop.time() + backoff >= deadline:
+                        break
+                    await asyncio.sleep(backoff)
+                    continue
+                breaker.record_success()
+                translation_cache.put(prompt, text)
+                return text
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+
+        breaker.record_failure()
+        if last_error is None or isinstance(last_error, asyncio.TimeoutError):
+            message = f"Gemini did not answer within {settings.gemini_timeout}s"
+        else:
+            message = f"Gemini request failed: {last_error!r}"
+        raise GeminiUnavailableError(message) from last_error
+
+    async def _attempt(self, prompt: str) -> str:
+        """Run one attempt, sending a hedged duplicate if the first request is slower than usual."""
+        loop = asyncio.get_running_loop()
+        primary = loop.run_in_executor(executor, self._timed_generate, prompt)
+
+        hedge_after = None
+        if settings.gemini_hedge_enabled:
+            hedge_after = latencies.percentile(settings.gemini_hedge_percentile)
+        if hedge_after is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        logger.info(f"Gemini call slower than {hedge_after:.3f}s, sending hedged request")
+        hedge = loop.run_in_executor(executor, self._timed_generate, prompt)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _timed_generate(self, prompt: str) -> str:
+        start_time = time.monotonic()
+        text = self._generate_sync(prompt)
+        latencies.record(time.monotonic() - start_time)
+        return text
 
     def _generate_sync(self, prompt: str) -> str:
         response = self.client.models.generate_content(